@@ -1,11 +1,14 @@
 # Lightweight undirected weighted graph
 from __future__ import annotations
+from statistics import mean, median
 from typing import Dict, Iterable, Tuple
 
 
 class MediaGraph:
     def __init__(self):
         self.adj: Dict[str, Dict[str, float]] = {}
+        # True while every neighbor dict is ordered by descending weight
+        self._neighbors_sorted = True
 
     # Adds node if missing
     def add_node(self, u: str) -> None:
@@ -20,7 +23,95 @@ class MediaGraph:
         self.add_node(v)
         self.adj[u][v] = w
         self.adj[v][u] = w
+        self._neighbors_sorted = False
 
-    # Returns (neighbor, weight) pairs
+    # Returns (neighbor, weight) pairs, strongest first once sort_neighbors() has run
     def neighbors(self, u: str) -> Iterable[Tuple[str, float]]:
         return self.adj.get(u, {}).items()
+
+    # Reorders every neighbor dict by descending weight (dicts keep insertion order)
+    def sort_neighbors(self) -> None:
+        if self._neighbors_sorted:
+            return
+        self.adj = {u: _by_weight(nbrs) for u, nbrs in self.adj.items()}
+        self._neighbors_sorted = True
+
+    def edge_count(self) -> int:
+        return sum(len(nbrs) for nbrs in self.adj.values()) // 2
+
+    # Summary of the degree distribution
+    def degree_stats(self) -> dict:
+        degrees = [len(nbrs) for nbrs in self.adj.values()] or [0]
+        histogram: Dict[int, int] = {}
+        for d in degrees:
+            histogram[d] = histogram.get(d, 0) + 1
+        return {
+            "edges": self.edge_count(),
+            "min": min(degrees),
+            "max": max(degrees),
+            "mean": round(mean(degrees), 2),
+            "median": median(degrees),
+            "histogram": dict(sorted(histogram.items())),
+        }
+
+    ## SPARSIFY
+    # Greedy degree-bounded pruning: edges >= min_weight are taken by descending weight and kept
+    # only while both endpoints have fewer than max_degree edges. The graph stays symmetric and no
+    # node exceeds max_degree, but a node may keep fewer than its own top max_degree neighbors
+    # when the other endpoint is already full.
+    # With keep_stranded, a node left with no edges gets back its strongest edge that fits
+    # (even below min_weight); the other endpoint may then go one edge over max_degree.
+    # These exceptions are counted as "fallback_edges" in the report.
+    def sparsify(self, max_degree: int, min_weight: float = 0.0, keep_stranded: bool = False) -> dict:
+        if max_degree < 0:
+            raise ValueError("max_degree must be non-negative")
+
+        before = self.degree_stats()
+
+        edges = sorted(
+            ((w, u, v) for u, nbrs in self.adj.items() for v, w in nbrs.items() if u < v),
+            key=lambda e: (-e[0], e[1], e[2]),
+        )
+
+        kept: Dict[str, Dict[str, float]] = {u: {} for u in self.adj}
+        for w, u, v in edges:
+            if w < min_weight:
+                break
+            if len(kept[u]) < max_degree and len(kept[v]) < max_degree:
+                kept[u][v] = w
+                kept[v][u] = w
+
+        fallback_edges = 0
+        if keep_stranded and max_degree > 0:
+            for u, nbrs in self.adj.items():
+                if kept[u] or not nbrs:
+                    continue
+                ranked = list(_by_weight(nbrs).items())
+                # Prefer a neighbor with room, else one at the cap (allowed one edge over)
+                pick = next(((v, w) for v, w in ranked if len(kept[v]) < max_degree), None) \
+                    or next(((v, w) for v, w in ranked if len(kept[v]) == max_degree), None)
+                if pick:
+                    v, w = pick
+                    kept[u][v] = w
+                    kept[v][u] = w
+                    fallback_edges += 1
+
+        self.adj = {u: _by_weight(nbrs) for u, nbrs in kept.items()}
+        self._neighbors_sorted = True
+
+        after = self.degree_stats()
+        return {
+            "max_degree": max_degree,
+            "min_weight": min_weight,
+            "fallback_edges": fallback_edges,
+            "edges_before": before["edges"],
+            "edges_after": after["edges"],
+            "edges_dropped": before["edges"] - after["edges"],
+            "degree_before": before,
+            "degree_after": after,
+        }
+
+
+# Neighbor dict ordered by descending weight (ties by id)
+def _by_weight(nbrs: Dict[str, float]) -> Dict[str, float]:
+    return dict(sorted(nbrs.items(), key=lambda kv: (-kv[1], kv[0])))
@@ -0,0 +1,98 @@
+# Prefix index (sorted array + binary search) for typeahead search
+from __future__ import annotations
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Tuple
+
+
+# Case- and accent-folds text and splits it into words ("Amélie" -> "amelie", "Jay-Z" -> "jay z")
+def normalize(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(w for w in re.split(r"[^\w]+", stripped.casefold()) if w)
+
+
+# Popularity of an item: rating (movies) or listeners (music)
+def item_popularity(item: dict) -> float:
+    return float(item.get("rating", item.get("listeners", 0.0)))
+
+
+class PrefixIndex:
+    def __init__(self):
+        # value -> (label, popularity)
+        self.entries: Dict[str, Tuple[str, float]] = {}
+        # Sorted (normalized key, value) pairs, one per word suffix of the label
+        self._keys: List[Tuple[str, str]] = []
+        # Values by descending popularity (answers the empty query)
+        self._by_popularity: List[str] = []
+        self._dirty = False
+
+    # Adds a value; a repeated value keeps its highest popularity
+    def add(self, value: str, label: str, popularity: float = 0.0) -> None:
+        _, prev = self.entries.get(value, (label, popularity))
+        self.entries[value] = (label, max(prev, popularity))
+        self._dirty = True
+
+    # Sorts the keys once so searches are binary searches
+    def build(self) -> "PrefixIndex":
+        keys: List[Tuple[str, str]] = []
+        for value, (label, _) in self.entries.items():
+            words = normalize(label).split(" ")
+            # Index every word start so "nolan" finds "Christopher Nolan"
+            for i in range(len(words)):
+                keys.append((" ".join(words[i:]), value))
+        keys.sort()
+        self._keys = keys
+        self._by_popularity = sorted(
+            self.entries, key=lambda v: (-self.entries[v][1], self.entries[v][0])
+        )
+        self._dirty = False
+        return self
+
+    # Returns up to `limit` values whose label has a word starting with `query`, most popular first
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        if self._dirty:
+            self.build()
+
+        q = normalize(query)
+        if not q:
+            return self._by_popularity[:limit]
+
+        matches = set()
+        i = bisect_left(self._keys, (q, ""))
+        while i < len(self._keys) and self._keys[i][0].startswith(q):
+            matches.add(self._keys[i][1])
+            i += 1
+
+        return heapq.nsmallest(
+            limit, matches, key=lambda v: (-self.entries[v][1], self.entries[v][0])
+        )
+
+    def label(self, value: str) -> str:
+        return self.entries.get(value, (value, 0.0))[0]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+# Index of item id -> title
+def build_title_index(items: Iterable[dict]) -> PrefixIndex:
+    index = PrefixIndex()
+    for item in items:
+        index.add(item["id"], item.get("title", item["id"]), item_popularity(item))
+    return index.build()
+
+
+# Index of people (director / artist / actors), ranked by their most popular item
+# (max, so a long filmography does not outrank a hit)
+def build_name_index(items: Iterable[dict], field: str) -> PrefixIndex:
+    index = PrefixIndex()
+    for item in items:
+        names = item.get(field) or []
+        if isinstance(names, str):
+            names = [names]
+        for name in names:
+            index.add(name, name, item_popularity(item))
+    return index.build()
@@ -1,5 +1,5 @@
 # Basic test: graph should link similar movies
-from app.utils.data_loader import build_movie_tree_graph
+from app.utils.data_loader import build_movie_tree_graph, build_music_tree_graph
 
 def test_graph_edges():
     # Load structure
@@ -10,3 +10,32 @@ def test_graph_edges():
     a, b = ids[0], ids[1]
     # They should be connected in the graph
     assert b in G.adj[a]
+
+def test_graph_sparsify():
+    tree, G, items = build_movie_tree_graph("app/data/movies.json")
+    original = {u: dict(nbrs) for u, nbrs in G.adj.items()}
+    report = G.sparsify(max_degree=5, min_weight=0.25)
+    assert report["edges_dropped"] == report["edges_before"] - report["edges_after"]
+    assert report["fallback_edges"] == 0
+    assert report["degree_after"]["max"] <= 5
+    for u, nbrs in G.adj.items():
+        weights = list(nbrs.values())
+        # Degree bounded, neighbors sorted strongest first, symmetric, above min weight
+        assert len(nbrs) <= 5
+        assert weights == sorted(weights, reverse=True)
+        for v, w in nbrs.items():
+            assert G.adj[v][u] == w and w >= 0.25
+        # Greedy rule: a strong edge is only dropped when an endpoint is full
+        for v, w in original[u].items():
+            if w >= 0.25 and v not in nbrs:
+                assert len(nbrs) == 5 or len(G.adj[v]) == 5
+
+def test_graph_sparsify_keeps_every_node_connected():
+    for build, path in [(build_movie_tree_graph, "app/data/movies.json"),
+                        (build_music_tree_graph, "app/data/music.json")]:
+        tree, G, items = build(path)
+        report = G.sparsify(max_degree=8, min_weight=0.25, keep_stranded=True)
+        assert report["fallback_edges"] > 0
+        assert report["degree_after"]["min"] > 0
+        # Only fallback edges may push a node one over the cap
+        assert report["degree_after"]["max"] <= 8 + 1
@@ -0,0 +1,35 @@
+# Basic test: typeahead index should fold case/accents and rank by popularity
+from app.models.prefix_index import PrefixIndex, build_name_index
+from app.utils.data_loader import build_movie_tree_graph
+
+def test_prefix_search():
+    index = PrefixIndex()
+    index.add("a", "Amélie", 8.3)
+    index.add("b", "American Beauty", 8.4)
+    index.add("c", "Heat", 8.3)
+    # Case- and accent-folded prefix, most popular first
+    assert index.search("AME") == ["b", "a"]
+    assert index.search("amel") == ["a"]
+    # Matches any word start, and empty query returns top-N overall
+    assert index.search("beau") == ["b"]
+    assert index.search("", limit=1) == ["b"]
+    # Hyphenated names: every word start is searchable
+    index.add("d", "Spider-Man", 7.3)
+    index.add("e", "Jay-Z", 900)
+    assert index.search("man") == ["d"]
+    assert index.search("jay") == ["e"]
+    assert index.search("spider-m") == ["d"]
+
+def test_name_index():
+    tree, G, items = build_movie_tree_graph("app/data/movies.json")
+    index = build_name_index(items, "director")
+    assert "Christopher Nolan" in index.search("nolan")
+
+def test_name_index_uses_max_popularity():
+    items = [
+        {"id": "1", "director": "Prolific", "rating": 6.0},
+        {"id": "2", "director": "Prolific", "rating": 6.5},
+        {"id": "3", "director": "Prodigy", "rating": 9.0},
+    ]
+    index = build_name_index(items, "director")
+    assert index.search("pro") == ["Prodigy", "Prolific"]
@@ -12,6 +12,7 @@ from app.utils.data_loader import (
     build_music_tree_graph,
 )
 from app.models.recommender import Recommender
+from app.models.prefix_index import build_title_index, build_name_index
 
 
 # STREAMLIT CONFIG (MUST BE FIRST)
@@ -255,25 +256,76 @@ def show_interactive_graph(G, items, prefs, seed_id, media_type, theme):
     return open("graph.html", encoding="utf-8").read()
 
 
+# CATALOG (built once per catalog, shared across reruns)
+TYPEAHEAD_LIMIT = 20
+
+# Graph sparsification: max edges per node, minimum edge weight
+MAX_DEGREE = 8
+MIN_EDGE_WEIGHT = 0.25  # drops genre-only edges (weight 0.2)
+
+
+@st.cache_resource
+def load_catalog(media_type):
+    if media_type == "Movies":
+        tree, G, items = build_movie_tree_graph("app/data/movies.json")
+        indexes = {
+            "title": build_title_index(items),
+            "director": build_name_index(items, "director"),
+            "actor": build_name_index(items, "actors"),
+        }
+    else:
+        tree, G, items = build_music_tree_graph("app/data/music.json")
+        indexes = {
+            "title": build_title_index(items),
+            "artist": build_name_index(items, "artist"),
+        }
+    report = G.sparsify(MAX_DEGREE, MIN_EDGE_WEIGHT, keep_stranded=True)
+    return tree, G, items, indexes, report
+
+
+# Search box + top-N matches instead of sending every option to the client
+def typeahead(label, index, key):
+    query = st.sidebar.text_input(f"Search {label.lower()}", key=f"{key}_query")
+    # Keep the current pick so editing the search does not reset it
+    current = st.session_state.get(key) or ""
+    matches = index.search(query, TYPEAHEAD_LIMIT)
+    options = [""] + ([current] if current else []) + [v for v in matches if v != current]
+    return st.sidebar.selectbox(
+        label, options, key=key,
+        # Explicit index: Streamlit versions that key selectboxes on options would reset to ""
+        index=options.index(current) if current else 0,
+        format_func=lambda v: index.label(v) if v else "",
+    )
+
+
 # SIDEBAR
 st.sidebar.title("🎬 Preferences")
 media_type = st.sidebar.selectbox("Media Type", ["Movies", "Music"])
+tree, G, items, indexes, sparsify_report = load_catalog(media_type)
 
 if media_type == "Movies":
-    tree, G, items = build_movie_tree_graph("app/data/movies.json")
     prefs = {
         "genre": st.sidebar.selectbox("Genre", sorted({m["genre"] for m in items})),
-        "director": st.sidebar.selectbox("Director (optional)", [""] + sorted({m["director"] for m in items})) or None,
-        "actor": st.sidebar.selectbox("Actor (optional)", [""] + sorted({a for m in items for a in m.get("actors", [])})) or None,
+        "director": typeahead("Director (optional)", indexes["director"], "director") or None,
+        "actor": typeahead("Actor (optional)", indexes["actor"], "actor") or None,
     }
-    seed = st.sidebar.selectbox("Seed Movie (optional)", [""] + [m["id"] for m in items])
+    seed = typeahead("Seed Movie (optional)", indexes["title"], "seed_movie")
 else:
-    tree, G, items = build_music_tree_graph("app/data/music.json")
     prefs = {
         "genre": st.sidebar.selectbox("Genre", sorted({s["genre"] for s in items})),
-        "artist": st.sidebar.selectbox("Artist (optional)", [""] + sorted({s["artist"] for s in items})) or None,
+        "artist": typeahead("Artist (optional)", indexes["artist"], "artist") or None,
     }
-    seed = st.sidebar.selectbox("Seed Song (optional)", [""] + [s["id"] for s in items])
+    seed = typeahead("Seed Song (optional)", indexes["title"], "seed_song")
+
+with st.sidebar.expander("📈 Graph stats"):
+    before, after = sparsify_report["degree_before"], sparsify_report["degree_after"]
+    st.markdown(
+        f"Edges: {sparsify_report['edges_before']} → {sparsify_report['edges_after']} "
+        f"({sparsify_report['edges_dropped']} dropped)  \n"
+        f"Fallback edges (stranded nodes): {sparsify_report['fallback_edges']}  \n"
+        f"Max degree: {before['max']} → {after['max']}  \n"
+        f"Mean degree: {before['mean']} → {after['mean']}"
+    )
 
 
 # MAIN UI
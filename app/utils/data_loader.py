@@ -58,6 +58,7 @@ def build_movie_tree_graph(path_json: str) -> Tuple[MediaTree, MediaGraph, List[
             if w > 0.0:
                 G.add_edge(a["id"], b["id"], min(w, 1.0))
 
+    G.sort_neighbors()
     return tree, G, data
 
 # Loads songs and build tree + similarity graph
@@ -93,6 +94,7 @@ def build_music_tree_graph(path_json: str) -> Tuple[MediaTree, MediaGraph, List[
             if w > 0.15:
                 G.add_edge(a["id"], b["id"], min(w, 1.0))
 
+    G.sort_neighbors()
     return tree, G, data
 
 